@@ -1,13 +1,42 @@
 import pygame
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
-from collections import deque
 from typing import Tuple
 
 
+def _update_scales(error_scale: float, output_scale: float, error: float, output: float,
+                   p_component: float, i_component: float, d_component: float) -> Tuple[float, float]:
+    """Grow the error/output scales so the newest sample stays in view"""
+    error_value = abs(error)
+    if error_value > error_scale * 0.95:
+        error_scale = error_value * 1.2
+    
+    output_value = max(abs(output), abs(p_component), abs(i_component), abs(d_component))
+    if output_value > output_scale * 0.95:
+        output_scale = output_value * 1.2
+    
+    return error_scale, output_scale
+
+
+def _decimate(data: np.ndarray, pixels: int) -> np.ndarray:
+    """Reduce (series, samples) data to a min/max envelope of two points per pixel column"""
+    rows, n = data.shape
+    bucket = -(-n // pixels)
+    usable = n - n % bucket
+    blocks = data[:, :usable].reshape(rows, -1, bucket)
+    
+    envelope = np.empty((rows, 2 * blocks.shape[1]), dtype=data.dtype)
+    # Row 0 is time: use the first and last sample time of each bucket
+    envelope[0, 0::2] = blocks[0, :, 0]
+    envelope[0, 1::2] = blocks[0, :, -1]
+    envelope[1:, 0::2] = blocks[1:].min(axis=2)
+    envelope[1:, 1::2] = blocks[1:].max(axis=2)
+    
+    # Samples that don't fill a whole bucket are kept as-is
+    return np.concatenate((envelope, data[:, usable:]), axis=1)
+
+
 class GraphPlotter:
     def __init__(self, x: int, y: int, width: int, height: int, 
                  max_points: int = 600, time_window: float = 20.0):
@@ -24,42 +53,23 @@ class GraphPlotter:
         self.error_range = (-self.error_scale, self.error_scale)
         self.output_range = (-self.output_scale, self.output_scale)
         
-        # Data storage - no maxlen, we'll manage the window ourselves
-        self.time_data = []
-        self.error_data = []
-        self.output_data = []
-        self.p_data = []
-        self.i_data = []
-        self.d_data = []
+        # Data storage - one ring buffer row per series (time, error, output,
+        # P, I, D). Every sample is written twice, max_points apart, so the
+        # latest samples are always available as one contiguous slice.
+        self._buf = np.zeros((6, 2 * max_points), dtype=np.float32)
+        self._head = 0
+        self._count = 0
         
         # Time tracking
         self.start_time = 0
         self.current_time = 0
         
-        # Create matplotlib figure
-        self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(width/100, height/100), dpi=100)
-        self.fig.patch.set_facecolor('#f0f0f0')
-        
-        # Configure axes
-        self.ax1.set_facecolor('#fafafa')
-        self.ax2.set_facecolor('#fafafa')
-        
-        self.ax1.grid(True, alpha=0.3)
-        self.ax2.grid(True, alpha=0.3)
+        # Visible x-axis range starts at x_min and scrolls in x_step increments
+        self.x_min = 0.0
+        self.x_step = 1.0
         
-        self.ax1.set_ylabel('Error', fontsize=12)
-        self.ax2.set_ylabel('Control Output', fontsize=12)
-        self.ax2.set_xlabel('Time (s)', fontsize=12)
-        
-        # Set tick label size
-        self.ax1.tick_params(labelsize=10)
-        self.ax2.tick_params(labelsize=10)
-        
-        # Adjust layout
-        self.fig.tight_layout(pad=1.0)
-        
-        # Create canvas
-        self.canvas = FigureCanvasAgg(self.fig)
+        # Axis limits the cached static background was rendered with
+        self._bg_key = None
         
         # Surface for blitting
         self.surface = None
@@ -67,106 +77,163 @@ class GraphPlotter:
         # Auto-zoom mode
         self.auto_zoom_enabled = True
         
+        self._init_figure()
+        
     def add_data(self, time: float, error: float, output: float, 
                  p_component: float, i_component: float, d_component: float):
         """Add new data point"""
-        if len(self.time_data) == 0:
+        if self._count == 0:
             self.start_time = time
             
         self.current_time = time - self.start_time
-        self.time_data.append(self.current_time)
-        self.error_data.append(error)
-        self.output_data.append(output)
-        self.p_data.append(p_component)
-        self.i_data.append(i_component)
-        self.d_data.append(d_component)
+        sample = (self.current_time, error, output, p_component, i_component, d_component)
+        self._buf[:, self._head] = sample
+        self._buf[:, self._head + self.max_points] = sample
+        self._head = (self._head + 1) % self.max_points
+        self._count = min(self._count + 1, self.max_points)
         
         # Auto-adjust scale if auto-zoom is enabled
         if self.auto_zoom_enabled:
-            # For error
-            if abs(error) > self.error_scale * 0.95:
-                self.error_scale = abs(error) * 1.2
-                self.error_range = (-self.error_scale, self.error_scale)
-            
-            # For output
-            max_output_value = max(abs(output), abs(p_component), abs(i_component), abs(d_component))
-            if max_output_value > self.output_scale * 0.95:
-                self.output_scale = max_output_value * 1.2
-                self.output_range = (-self.output_scale, self.output_scale)
+            error_scale, output_scale = _update_scales(
+                self.error_scale, self.output_scale,
+                error, output, p_component, i_component, d_component
+            )
+            if error_scale != self.error_scale:
+                self.error_scale = error_scale
+                self.error_range = (-error_scale, error_scale)
+            if output_scale != self.output_scale:
+                self.output_scale = output_scale
+                self.output_range = (-output_scale, output_scale)
         
     def update(self):
         """Update the plots"""
-        if len(self.time_data) < 2:
+        if self._count < 2:
             return
+        
+        # Scroll the x-axis in whole tick steps so the cached background
+        # stays valid between steps
+        if self.current_time > self.x_min + self.time_window:
+            self.x_min = np.ceil((self.current_time - self.time_window) / self.x_step) * self.x_step
+        
+        # Re-render the static background only when the axis limits changed
+        bg_key = (self.x_min, self.error_range, self.output_range)
+        if bg_key != self._bg_key:
+            self._refresh_background()
+            self._bg_key = bg_key
             
-        # Clear axes
-        self.ax1.clear()
-        self.ax2.clear()
-        
-        # Convert to numpy arrays
-        time_array = np.array(self.time_data)
-        
-        # Filter data to only show points within the display window
-        if self.current_time > self.time_window:
-            min_time = self.current_time - self.time_window
-            mask = time_array >= min_time
-            time_array = time_array[mask]
-            error_array = np.array(self.error_data)[mask]
-            output_array = np.array(self.output_data)[mask]
-            p_array = np.array(self.p_data)[mask]
-            i_array = np.array(self.i_data)[mask]
-            d_array = np.array(self.d_data)[mask]
-        else:
-            error_array = np.array(self.error_data)
-            output_array = np.array(self.output_data)
-            p_array = np.array(self.p_data)
-            i_array = np.array(self.i_data)
-            d_array = np.array(self.d_data)
-        
-        # Plot error
-        self.ax1.plot(time_array, error_array, 'b-', linewidth=2, label='Error')
-        self.ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-        self.ax1.set_ylabel('Error (pixels)', fontsize=12)
-        self.ax1.set_ylim(self.error_range)
+        data = self._samples()
+        
+        # Filter data to only show points within the display window; time is
+        # monotonic so the window start is a binary search and the result a view
+        if self.x_min > 0:
+            data = data[:, np.searchsorted(data[0], self.x_min):]
+        
+        # More than two samples per pixel column can't be told apart on screen
+        if data.shape[1] > 2 * self.plot_pixels:
+            data = _decimate(data, self.plot_pixels)
+        self._render(data)
+        
+    def _init_figure(self):
+        """Create the matplotlib figure, axes and persistent line artists"""
+        # The figure is created without pyplot so no global figure manager or
+        # GUI backend is involved; it renders only through the Agg canvas below
+        self.fig = Figure(figsize=(self.width/100, self.height/100), dpi=100)
+        self.ax1, self.ax2 = self.fig.subplots(2, 1)
+        self.fig.patch.set_facecolor('#f0f0f0')
+        
+        # Configure axes
+        self.ax1.set_facecolor('#fafafa')
+        self.ax2.set_facecolor('#fafafa')
+        
         self.ax1.grid(True, alpha=0.3)
-        self.ax1.legend(loc='upper left', fontsize=10)
+        self.ax2.grid(True, alpha=0.3)
         
-        # Plot control output and components
-        self.ax2.plot(time_array, output_array, 'k-', linewidth=2, label='Total')
-        self.ax2.plot(time_array, p_array, 'g--', alpha=0.7, label='P')
-        self.ax2.plot(time_array, i_array, 'r--', alpha=0.7, label='I')
-        self.ax2.plot(time_array, d_array, 'b--', alpha=0.7, label='D')
-        self.ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        self.ax1.set_ylabel('Error (pixels)', fontsize=12)
         self.ax2.set_ylabel('Control Output (N)', fontsize=12)
         self.ax2.set_xlabel('Time (s)', fontsize=12)
-        self.ax2.set_ylim(self.output_range)
-        self.ax2.grid(True, alpha=0.3)
-        self.ax2.legend(loc='upper left', fontsize=10)
-        
-        # Set x-axis limits - always show a fixed time window
-        if self.current_time <= self.time_window:
-            # Show from 0 to time_window when we haven't filled the window yet
-            self.ax1.set_xlim(0, self.time_window)
-            self.ax2.set_xlim(0, self.time_window)
-        else:
-            # Show sliding window of the most recent data
-            self.ax1.set_xlim(self.current_time - self.time_window, self.current_time)
-            self.ax2.set_xlim(self.current_time - self.time_window, self.current_time)
         
         # Set tick label size
         self.ax1.tick_params(labelsize=10)
         self.ax2.tick_params(labelsize=10)
         
-        # Render to pygame surface
+        # Line artists are created once and only their data changes per update.
+        # They are animated so that canvas.draw() renders just the static parts.
+        self.error_line, = self.ax1.plot([], [], 'b-', linewidth=2, label='Error', animated=True)
+        self.output_line, = self.ax2.plot([], [], 'k-', linewidth=2, label='Total', animated=True)
+        self.p_line, = self.ax2.plot([], [], 'g--', alpha=0.7, label='P', animated=True)
+        self.i_line, = self.ax2.plot([], [], 'r--', alpha=0.7, label='I', animated=True)
+        self.d_line, = self.ax2.plot([], [], 'b--', alpha=0.7, label='D', animated=True)
+        
+        self.ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        self.ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        self.ax1.legend(loc='upper left', fontsize=10)
+        self.ax2.legend(loc='upper left', fontsize=10)
+        
+        # Adjust layout
+        self.fig.tight_layout(pad=1.0)
+        
+        # Create canvas
+        self.canvas = FigureCanvasAgg(self.fig)
+        
+        # Cached static backgrounds for blitting
+        self._bg1 = None
+        self._bg2 = None
+        self._agg_surface = None
+        self.plot_pixels = int(self.ax1.bbox.width)
+        
+    def _render(self, data: np.ndarray):
+        """Draw the windowed (6, n) sample data on top of the cached background"""
+        time_array, error_array, output_array, p_array, i_array, d_array = data
+        
+        # Update line data
+        self.error_line.set_data(time_array, error_array)
+        self.output_line.set_data(time_array, output_array)
+        self.p_line.set_data(time_array, p_array)
+        self.i_line.set_data(time_array, i_array)
+        self.d_line.set_data(time_array, d_array)
+        
+        # Restore the cached backgrounds and draw only the lines on top
+        self.canvas.restore_region(self._bg1)
+        self.ax1.draw_artist(self.error_line)
+        self.canvas.blit(self.ax1.bbox)
+        
+        self.canvas.restore_region(self._bg2)
+        self.ax2.draw_artist(self.output_line)
+        self.ax2.draw_artist(self.p_line)
+        self.ax2.draw_artist(self.i_line)
+        self.ax2.draw_artist(self.d_line)
+        self.canvas.blit(self.ax2.bbox)
+        
+        # The Agg surface wraps the canvas buffer directly, so it only needs to
+        # be created once; Agg reuses the same buffer for every draw. It is
+        # copied into a display-format surface here, once per update, so the
+        # per-frame screen blit needs no pixel format conversion.
+        if self.surface is None:
+            size = self.canvas.get_width_height()
+            self._agg_surface = pygame.image.frombuffer(self.canvas.buffer_rgba(), size, "RGBA")
+            self.surface = pygame.Surface(size).convert()
+        self.surface.blit(self._agg_surface, (0, 0))
+        
+    def _samples(self) -> np.ndarray:
+        """Stored samples in time order as a (6, count) view of the ring buffer"""
+        end = self._head + self.max_points
+        return self._buf[:, end - self._count:end]
+        
+    def _refresh_background(self):
+        """Render the static parts of the figure and cache them for blitting"""
+        self.ax1.set_xlim(self.x_min, self.x_min + self.time_window)
+        self.ax2.set_xlim(self.x_min, self.x_min + self.time_window)
+        self.ax1.set_ylim(self.error_range)
+        self.ax2.set_ylim(self.output_range)
+        
         self.canvas.draw()
-        renderer = self.canvas.get_renderer()
-        raw_data = renderer.buffer_rgba()
-        size = self.canvas.get_width_height()
+        self._bg1 = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self._bg2 = self.canvas.copy_from_bbox(self.ax2.bbox)
         
-        #raw_data = renderer.buffer_rgba()
-        self.surface = pygame.image.frombuffer(raw_data, size, "RGBA")
-
-        #self.surface = pygame.image.fromstring(raw_data, size, "RGB")
+        # Scroll step follows the major tick spacing
+        ticks = self.ax1.get_xticks()
+        if len(ticks) > 1:
+            self.x_step = ticks[1] - ticks[0]
         
     def draw(self, screen: pygame.Surface):
         """Draw the graphs to the screen"""
@@ -180,14 +247,11 @@ class GraphPlotter:
             
     def reset(self):
         """Clear all data"""
-        self.time_data = []
-        self.error_data = []
-        self.output_data = []
-        self.p_data = []
-        self.i_data = []
-        self.d_data = []
+        self._head = 0
+        self._count = 0
         self.start_time = 0
         self.current_time = 0
+        self.x_min = 0.0
         
     def zoom_in_y(self):
         """Zoom in on Y axes (reduce scale)"""
@@ -209,13 +273,138 @@ class GraphPlotter:
         """Auto-scale Y axes based on data and re-enable auto-zoom"""
         self.auto_zoom_enabled = True  # Re-enable auto-zoom
         
-        if len(self.error_data) > 0:
-            max_error = max(abs(min(self.error_data)), abs(max(self.error_data)))
+        if self._count > 0:
+            data = self._samples()
+            max_error = float(np.abs(data[1]).max())
             self.error_scale = max(1, min(2000, max_error * 1.2))
             self.error_range = (-self.error_scale, self.error_scale)
             
-        if len(self.output_data) > 0:
-            all_outputs = self.output_data + self.p_data + self.i_data + self.d_data
-            max_output = max(abs(min(all_outputs)), abs(max(all_outputs)))
+            # Output and P/I/D rows are contiguous, so one pass covers all four
+            max_output = float(np.abs(data[2:6]).max())
             self.output_scale = max(10, min(2000, max_output * 1.2))
             self.output_range = (-self.output_scale, self.output_scale)
+
+
+def _nice_step(span: float, max_ticks: int = 8) -> float:
+    """Pick a 1/2/2.5/5 x 10^n tick spacing giving at most max_ticks intervals"""
+    raw = span / max_ticks
+    magnitude = 10 ** np.floor(np.log10(raw))
+    for multiple in (1, 2, 2.5, 5, 10):
+        if multiple * magnitude >= raw:
+            return multiple * magnitude
+    return 10 * magnitude
+
+
+class FastGraphPlotter(GraphPlotter):
+    """GraphPlotter drawn directly with pygame instead of matplotlib
+    
+    Axes, grid, tick labels and legends are rendered once into a background
+    surface; each update only copies that background and draws the six
+    series as pygame line strips.
+    """
+    
+    def _init_figure(self):
+        """Lay out the two plot areas and prepare fonts and colors"""
+        self.bg_color = (240, 240, 240)
+        self.plot_color = (250, 250, 250)
+        self.grid_color = (225, 225, 225)
+        self.zero_color = (180, 180, 180)
+        self.border_color = (0, 0, 0)
+        self.text_color = (0, 0, 0)
+        
+        # (label, color, line width) for error, total, P, I, D
+        self.series_styles = [
+            ('Error', (0, 0, 255), 2),
+            ('Total', (0, 0, 0), 2),
+            ('P', (0, 160, 0), 1),
+            ('I', (220, 0, 0), 1),
+            ('D', (60, 60, 255), 1),
+        ]
+        
+        self.font = pygame.font.Font(None, 20)
+        self.label_font = pygame.font.Font(None, 24)
+        
+        # Two stacked plot areas, leaving room for tick labels and axis titles
+        left, right, top, bottom, gap = 75, 15, 10, 45, 35
+        plot_width = self.width - left - right
+        plot_height = (self.height - top - bottom - gap) // 2
+        self.rect1 = pygame.Rect(left, top, plot_width, plot_height)
+        self.rect2 = pygame.Rect(left, top + plot_height + gap, plot_width, plot_height)
+        
+        self.plot_pixels = plot_width
+        self._background = pygame.Surface((self.width, self.height)).convert()
+        
+    def _refresh_background(self):
+        """Render axes, grid, ticks and legends into the cached background"""
+        self.x_step = _nice_step(self.time_window)
+        
+        bg = self._background
+        bg.fill(self.bg_color)
+        self._draw_axes(bg, self.rect1, self.error_scale, 'Error (pixels)', self.series_styles[:1])
+        self._draw_axes(bg, self.rect2, self.output_scale, 'Control Output (N)', self.series_styles[1:])
+        
+        # Shared time axis labels under each plot
+        x_max = self.x_min + self.time_window
+        tick = np.ceil(self.x_min / self.x_step) * self.x_step
+        while tick <= x_max + 1e-9:
+            px = self.rect1.left + (tick - self.x_min) / self.time_window * self.rect1.width
+            text = self.font.render(f"{tick:g}", True, self.text_color)
+            for rect in (self.rect1, self.rect2):
+                pygame.draw.line(bg, self.grid_color, (px, rect.top), (px, rect.bottom - 1))
+                bg.blit(text, text.get_rect(midtop=(px, rect.bottom + 4)))
+            tick += self.x_step
+            
+        title = self.label_font.render('Time (s)', True, self.text_color)
+        bg.blit(title, title.get_rect(midbottom=(self.rect2.centerx, self.height - 2)))
+        
+        for rect in (self.rect1, self.rect2):
+            pygame.draw.rect(bg, self.border_color, rect, 1)
+        
+    def _draw_axes(self, bg: pygame.Surface, rect: pygame.Rect, scale: float,
+                   label: str, styles: list):
+        """Draw one plot area with its y grid, tick labels, title and legend"""
+        pygame.draw.rect(bg, self.plot_color, rect)
+        
+        step = _nice_step(2 * scale)
+        tick = -np.floor(scale / step) * step
+        while tick <= scale + 1e-9:
+            py = rect.centery - tick / scale * (rect.height / 2)
+            color = self.zero_color if abs(tick) < step / 2 else self.grid_color
+            pygame.draw.line(bg, color, (rect.left, py), (rect.right - 1, py))
+            text = self.font.render(f"{tick:g}", True, self.text_color)
+            bg.blit(text, text.get_rect(midright=(rect.left - 4, py)))
+            tick += step
+            
+        title = pygame.transform.rotate(self.label_font.render(label, True, self.text_color), 90)
+        bg.blit(title, title.get_rect(midleft=(2, rect.centery)))
+        
+        # Legend
+        y = rect.top + 6
+        for name, color, width in styles:
+            pygame.draw.line(bg, color, (rect.left + 8, y + 7), (rect.left + 30, y + 7), width)
+            bg.blit(self.font.render(name, True, self.text_color), (rect.left + 36, y))
+            y += 16
+            
+    def _render(self, data: np.ndarray):
+        """Copy the cached background and draw the series as line strips"""
+        if self.surface is None:
+            self.surface = pygame.Surface((self.width, self.height)).convert()
+        surface = self.surface
+        surface.blit(self._background, (0, 0))
+        
+        # Map time to pixel columns once; both plots share the x-axis
+        px = self.rect1.left + (data[0] - self.x_min) * (self.rect1.width / self.time_window)
+        
+        series = (
+            (self.rect1, self.error_scale, data[1], self.series_styles[0]),
+            (self.rect2, self.output_scale, data[2], self.series_styles[1]),
+            (self.rect2, self.output_scale, data[3], self.series_styles[2]),
+            (self.rect2, self.output_scale, data[4], self.series_styles[3]),
+            (self.rect2, self.output_scale, data[5], self.series_styles[4]),
+        )
+        for rect, scale, values, (_, color, width) in series:
+            py = rect.centery - values * (rect.height / (2 * scale))
+            points = np.column_stack((px, py)).tolist()
+            surface.set_clip(rect)
+            pygame.draw.lines(surface, color, False, points, width)
+        surface.set_clip(None)
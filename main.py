@@ -6,7 +6,7 @@ from typing import Tuple
 from physics_platform import Platform
 from pid_controller import PIDController
 from ui_controls import ControlPanel
-from graph_plotter import GraphPlotter
+from graph_plotter import GraphPlotter, FastGraphPlotter
 
 
 @dataclass
@@ -18,6 +18,7 @@ class SimulationConfig:
     center_line_color: Tuple[int, int, int] = (200, 200, 200)
     control_panel_width: int = 450  # Increased width for better layout
     graph_height: int = 400
+    graph_window: float = 20.0  # Seconds of data shown in the graphs
     
     # Physics
     gravity: float = 9.81
@@ -25,15 +26,35 @@ class SimulationConfig:
     
     # Simulation
     simulation_speed: float = 2.2  # 1.0 = real-time, 0.5 = half speed, 2.0 = double speed
+    
+    # Graphs are re-rendered at this rate, independently of the physics/PID
+    # loop which runs at fps; data is still collected every frame
+    plot_fps: int = 15
+    
+    # Draw graphs with pygame directly instead of matplotlib (cheaper to
+    # render, plainer look)
+    fast_graphs: bool = False
+    
+    # Decimals shown in the PID state panel; coarser values change less
+    # often, so their rendered text is reused from the cache
+    info_decimals: int = 1
 
 
 class PIDSimulator:
+    EVENT_TYPES = [
+        pygame.QUIT, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP
+    ]
+    
     def __init__(self, config: SimulationConfig = SimulationConfig()):
         self.config = config
         pygame.init()
         self.screen = pygame.display.set_mode((config.width, config.height))
         pygame.display.set_caption("PID Controller Simulation")
-        self.clock = pygame.time.Clock()
+        
+        # Only queue the events the simulation and control panel consume
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.EVENT_TYPES)
         self.running = True
         self.dt = 1.0 / config.fps
         
@@ -56,76 +77,82 @@ class PIDSimulator:
         self.control_panel = ControlPanel(self.sim_width + 20, 20)
         
         # Create graph plotter at the bottom
-        self.graph_plotter = GraphPlotter(
+        plotter_class = FastGraphPlotter if config.fast_graphs else GraphPlotter
+        self.graph_plotter = plotter_class(
             x=10,
             y=self.sim_height + 10,
             width=self.sim_width - 20,
             height=config.graph_height - 20,
-            time_window=20.0  # Show 20 seconds of data
+            # Enough samples to fill the window at the slowest simulation speed
+            max_points=int(config.graph_window * config.fps
+                           / self.control_panel.sliders['speed'].min_val),
+            time_window=config.graph_window
         )
         
-        # PID enabled states
-        self.pid_enabled = {'kp': True, 'ki': True, 'kd': True}
+        # P, I, D components of the latest update with disabled terms zeroed
+        self.components = (0.0, 0.0, 0.0)
         
         # Fonts for display
         self.font = pygame.font.Font(None, 32)
         self.small_font = pygame.font.Font(None, 28)
         
+        # Rendered text surfaces keyed by (text, color, font)
+        self.text_cache = {}
+        self.text_cache_size = 256
+        
+        # Pre-rendered component bar backgrounds keyed by (width, height)
+        self.bar_templates = {}
+        
+        # Pre-rendered static background
+        self.background = self.build_background()
+        
         # Time tracking
-        self.start_time = time.time()
+        # Monotonic integer nanoseconds, immune to wall-clock adjustments
+        self.start_ns = time.monotonic_ns()
         self.simulation_time = 0.0
-        self.last_graph_update = 0
-        self.graph_update_interval = 0.05  # Update graphs every 50ms
+        self.last_graph_ns = 0
+        self.graph_interval_ns = 1_000_000_000 // config.plot_fps
+        
+        # Frame pacing
+        self.frame_ns = 1_000_000_000 // config.fps
+        self.next_frame_ns = time.monotonic_ns()
         
         # Simulation speed
         self.simulation_speed = config.simulation_speed
         
-    def draw(self):
-        self.screen.fill(self.config.background_color)
-        
-        # Draw boundaries
-        # Vertical separator for control panel
-        pygame.draw.line(
-            self.screen,
-            (150, 150, 150),
-            (self.sim_width, 0),
-            (self.sim_width, self.config.height),
-            2
-        )
-        
-        # Horizontal separator for graphs
-        pygame.draw.line(
-            self.screen,
-            (150, 150, 150),
-            (0, self.sim_height),
-            (self.sim_width, self.sim_height),
-            2
-        )
+        # Screen regions pushed to the display each frame. Static areas are
+        # only pushed on a full redraw; the graphs only when they may have
+        # changed and the control panel only where its widgets changed. In
+        # the simulation area only the rects of moving elements are pushed.
+        panel_split_y = 470  # Between the control panel and the PID state info
+        self.panel_rect = pygame.Rect(self.sim_width, 0, config.control_panel_width, panel_split_y)
+        self.info_rect = pygame.Rect(self.sim_width, panel_split_y,
+                                     config.control_panel_width, config.height - panel_split_y)
+        self.graph_rect = pygame.Rect(0, self.sim_height, self.sim_width, config.graph_height)
+        self.full_redraw = True
+        self.panel_rects = []
+        self.pointer_in_panel = False
+        self.panel_captured = False
+        self.graph_dirty = False
+        self.scene_rects = []
+        self.last_scene_rects = []
         
-        # Draw center line in simulation area
-        pygame.draw.line(
-            self.screen, 
-            self.config.center_line_color,
-            (self.center_x, 0),
-            (self.center_x, self.sim_height),
-            2
-        )
+    def draw(self):
+        # Static background: separators, center line and deadband zone
+        self.screen.blit(self.background, (0, 0))
         
         # Draw platform
-        self.platform.draw(self.screen)
+        self.scene_rects.append(self.platform.draw(self.screen))
         
         # Draw wind indicator
         self.draw_wind_indicator()
         
-        # Draw deadband indicator
-        self.draw_deadband_indicator()
-        
         # Draw force visualization
-        if hasattr(self.pid, 'state') and self.pid.state.output != 0:
+        if self.pid.state.output != 0:
             self.draw_force_arrow()
         
         # Draw control panel
-        self.control_panel.draw(self.screen)
+        self.panel_rects = self.control_panel.draw(self.screen)
         
         # Draw PID state info
         self.draw_pid_info()
@@ -141,7 +168,25 @@ class PIDSimulator:
         
         # No need to draw instructions anymore as we have UI controls
         
-        pygame.display.flip()
+        self.present()
+        
+    def present(self):
+        """Push the changed parts of the frame to the display"""
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            # Scene elements are pushed where they are now and where they
+            # were last frame, so their old positions get cleared
+            dirty_rects = self.scene_rects + self.last_scene_rects
+            dirty_rects.append(self.info_rect)
+            dirty_rects += self.panel_rects
+            if self.graph_dirty:
+                dirty_rects.append(self.graph_rect)
+            pygame.display.update(dirty_rects)
+        self.graph_dirty = False
+        self.last_scene_rects = self.scene_rects
+        self.scene_rects = []
         
     def draw_wind_indicator(self):
         """Draw wind direction and strength indicator"""
@@ -154,30 +199,56 @@ class PIDSimulator:
             wind_scale = 10
             wind_length = int(self.platform.wind_force * wind_scale)
             
-            # Draw wind arrow
-            arrow_start = (wind_x, wind_y)
-            arrow_end = (wind_x + wind_length, wind_y)
-            
             # Wind color (blue-ish)
             wind_color = (100, 150, 255)
             
-            pygame.draw.line(self.screen, wind_color, arrow_start, arrow_end, 4)
-            
-            # Arrow head
-            if wind_length != 0:
-                sign = 1 if wind_length > 0 else -1
-                pygame.draw.polygon(self.screen, wind_color, [
-                    arrow_end,
-                    (arrow_end[0] - sign * 10, arrow_end[1] - 5),
-                    (arrow_end[0] - sign * 10, arrow_end[1] + 5)
-                ])
+            # Draw wind arrow
+            self.draw_arrow(wind_color, wind_x, wind_y, wind_length, 4)
             
             # Wind label
-            wind_text = self.small_font.render(f"Wind: {self.platform.wind_force:.1f}", True, wind_color)
+            wind_text = self.render_text(f"Wind: {self.platform.wind_force:.1f}", self.small_font, wind_color)
             text_rect = wind_text.get_rect(center=(wind_x, wind_y - 20))
-            self.screen.blit(wind_text, text_rect)
+            self.scene_rects.append(self.screen.blit(wind_text, text_rect))
     
-    def draw_deadband_indicator(self):
+    def build_background(self) -> pygame.Surface:
+        """Render the parts of the frame that never change"""
+        background = pygame.Surface((self.config.width, self.config.height)).convert()
+        background.fill(self.config.background_color)
+        
+        # Draw boundaries
+        # Vertical separator for control panel
+        pygame.draw.line(
+            background,
+            (150, 150, 150),
+            (self.sim_width, 0),
+            (self.sim_width, self.config.height),
+            2
+        )
+        
+        # Horizontal separator for graphs
+        pygame.draw.line(
+            background,
+            (150, 150, 150),
+            (0, self.sim_height),
+            (self.sim_width, self.sim_height),
+            2
+        )
+        
+        # Draw center line in simulation area
+        pygame.draw.line(
+            background, 
+            self.config.center_line_color,
+            (self.center_x, 0),
+            (self.center_x, self.sim_height),
+            2
+        )
+        
+        # Draw deadband indicator
+        self.draw_deadband_indicator(background)
+        
+        return background
+        
+    def draw_deadband_indicator(self, surface: pygame.Surface):
         """Draw deadband zone indicator"""
         # Draw a subtle shaded area around center to show deadband
         deadband_pixels = 200  # Visual representation of deadband zone
@@ -187,15 +258,15 @@ class PIDSimulator:
             2 * deadband_pixels,
             120
         )
-        deadband_surface = pygame.Surface((deadband_rect.width, deadband_rect.height))
+        deadband_surface = pygame.Surface((deadband_rect.width, deadband_rect.height)).convert()
         deadband_surface.set_alpha(60)  # More visible
         deadband_surface.fill((255, 150, 150))
-        self.screen.blit(deadband_surface, deadband_rect)
+        surface.blit(deadband_surface, deadband_rect)
         
         # Label
         deadband_text = self.small_font.render("Deadband Zone", True, (200, 100, 100))
         text_rect = deadband_text.get_rect(center=(self.center_x, self.sim_height - 170))
-        self.screen.blit(deadband_text, text_rect)
+        surface.blit(deadband_text, text_rect)
     
     def draw_force_arrow(self):
         """Draw force arrow on platform"""
@@ -203,120 +274,109 @@ class PIDSimulator:
         force_x = int(self.pid.state.output * force_scale)
         
         # Draw force arrow
-        arrow_y = self.platform.y
-        arrow_start = (self.platform.x, arrow_y)
-        arrow_end = (self.platform.x + force_x, arrow_y)
+        self.draw_arrow((255, 0, 0), self.platform.x, self.platform.y, force_x, 3)
         
-        pygame.draw.line(self.screen, (255, 0, 0), arrow_start, arrow_end, 3)
+    def draw_arrow(self, color, x, y, length, width):
+        """Draw a horizontal arrow from (x, y) with a signed length"""
+        tip_x = x + length
+        self.scene_rects.append(
+            pygame.draw.line(self.screen, color, (x, y), (tip_x, y), width)
+        )
         
         # Arrow head
-        if force_x != 0:
-            sign = 1 if force_x > 0 else -1
-            pygame.draw.polygon(self.screen, (255, 0, 0), [
-                arrow_end,
-                (arrow_end[0] - sign * 10, arrow_end[1] - 5),
-                (arrow_end[0] - sign * 10, arrow_end[1] + 5)
-            ])
+        if length != 0:
+            back_x = tip_x - 10 if length > 0 else tip_x + 10
+            self.scene_rects.append(pygame.draw.polygon(
+                self.screen, color, ((tip_x, y), (back_x, y - 5), (back_x, y + 5))
+            ))
             
     def draw_pid_info(self):
         """Draw PID state information"""
-        if not hasattr(self.pid, 'state'):
-            return
-            
         x_offset = self.sim_width + 20
         y_offset = 480  # Move down more to avoid overlap with controls and buttons
         
+        # Text surfaces are collected and blitted in a single batch
+        blit_list = []
+        
         # Title
-        title = self.font.render("PID State", True, (0, 0, 0))
-        self.screen.blit(title, (x_offset, y_offset))
+        title = self.render_text("PID State", self.font, (0, 0, 0))
+        blit_list.append((title, (x_offset, y_offset)))
         
         y_offset += 35
         
         # Error
-        error_text = self.small_font.render(
-            f"Error: {self.pid.state.error:.2f}", 
-            True, (0, 0, 0)
-        )
-        self.screen.blit(error_text, (x_offset, y_offset))
+        self.queue_value_text(blit_list, "Error: ", self.pid.state.error,
+                              (0, 0, 0), (x_offset, y_offset))
         
         y_offset += 25
         
-        # Get components
-        p_term, i_term, d_term = self.pid.get_components()
-        
-        # Apply enabled states
-        if not self.pid_enabled.get('kp', True):
-            p_term = 0
-        if not self.pid_enabled.get('ki', True):
-            i_term = 0
-        if not self.pid_enabled.get('kd', True):
-            d_term = 0
+        # Components with disabled terms zeroed, computed once per frame in run()
+        p_term, i_term, d_term = self.components
         
         # P component
-        p_text = self.small_font.render(
-            f"P component: {p_term:.2f}", 
-            True, (0, 100, 0)
-        )
-        self.screen.blit(p_text, (x_offset, y_offset))
+        self.queue_value_text(blit_list, "P component: ", p_term,
+                              (0, 100, 0), (x_offset, y_offset))
         
         y_offset += 25
         
         # I component
-        i_text = self.small_font.render(
-            f"I component: {i_term:.2f}", 
-            True, (100, 0, 0)
-        )
-        self.screen.blit(i_text, (x_offset, y_offset))
+        self.queue_value_text(blit_list, "I component: ", i_term,
+                              (100, 0, 0), (x_offset, y_offset))
         
         y_offset += 25
         
         # D component
-        d_text = self.small_font.render(
-            f"D component: {d_term:.2f}", 
-            True, (0, 0, 100)
-        )
-        self.screen.blit(d_text, (x_offset, y_offset))
+        self.queue_value_text(blit_list, "D component: ", d_term,
+                              (0, 0, 100), (x_offset, y_offset))
         
         y_offset += 25
         
         # Total output
-        output_text = self.small_font.render(
-            f"Total output: {self.pid.state.output:.2f}", 
-            True, (0, 0, 0)
-        )
-        self.screen.blit(output_text, (x_offset, y_offset))
+        self.queue_value_text(blit_list, "Total output: ", self.pid.state.output,
+                              (0, 0, 0), (x_offset, y_offset))
+        
+        self.screen.blits(blit_list, doreturn=False)
+        
+    def queue_value_text(self, blit_list, label, value, color, pos):
+        """Queue a label and its value as two cached text surfaces"""
+        label_text = self.render_text(label, self.small_font, color)
+        value_text = self.render_text(f"{value:.{self.config.info_decimals}f}",
+                                      self.small_font, color)
+        blit_list.append((label_text, pos))
+        blit_list.append((value_text, (pos[0] + label_text.get_width(), pos[1])))
+        
+    def render_text(self, text, font, color) -> pygame.Surface:
+        """Render text, reusing surfaces for recently drawn strings"""
+        key = (text, color, id(font))
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= self.text_cache_size:
+                # Evict the oldest entry
+                del self.text_cache[next(iter(self.text_cache))]
+            # Match the display format so cached blits skip pixel conversion
+            surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surface
+        return surface
         
     def draw_deadband_status(self):
         """Show if platform is stuck in deadband"""
-        if hasattr(self.pid, 'state'):
-            total_force = self.pid.state.output + self.platform.wind_force
-            if abs(total_force) < 5.0 and abs(self.platform.velocity) < 0.5:
-                # In deadband
-                status_text = self.font.render("STUCK IN DEADBAND", True, (255, 0, 0))
-                text_rect = status_text.get_rect(center=(self.center_x, self.sim_height - 200))
-                self.screen.blit(status_text, text_rect)
+        total_force = self.pid.state.output + self.platform.wind_force
+        if abs(total_force) < 5.0 and abs(self.platform.velocity) < 0.5:
+            # In deadband
+            status_text = self.render_text("STUCK IN DEADBAND", self.font, (255, 0, 0))
+            text_rect = status_text.get_rect(center=(self.center_x, self.sim_height - 200))
+            self.scene_rects.append(self.screen.blit(status_text, text_rect))
     
     def draw_component_bars(self):
         """Draw visual bars for PID components"""
-        if not hasattr(self.pid, 'state'):
-            return
-            
         bar_x = self.sim_width + 40  # Move right to make room for labels
         bar_y = 720  # Move down to avoid overlap with PID state text
         bar_width = 380
         bar_height = 25
         max_value = 50  # Scale for visualization
         
-        # Get components
-        p_term, i_term, d_term = self.pid.get_components()
-        
-        # Apply enabled states
-        if not self.pid_enabled.get('kp', True):
-            p_term = 0
-        if not self.pid_enabled.get('ki', True):
-            i_term = 0
-        if not self.pid_enabled.get('kd', True):
-            d_term = 0
+        # Components with disabled terms zeroed, computed once per frame in run()
+        p_term, i_term, d_term = self.components
         
         # P bar
         self.draw_bar(bar_x, bar_y, bar_width, bar_height, 
@@ -334,15 +394,13 @@ class PIDSimulator:
         
     def draw_bar(self, x, y, width, height, value, max_value, color, label):
         """Draw a single component bar"""
-        # Background
-        bg_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, (200, 200, 200), bg_rect)
-        pygame.draw.rect(self.screen, (100, 100, 100), bg_rect, 1)
-        
-        # Center line
+        # Background, border and center line come from a pre-rendered template
+        template = self.bar_templates.get((width, height))
+        if template is None:
+            template = self.build_bar_template(width, height)
+            self.bar_templates[(width, height)] = template
+        self.screen.blit(template, (x, y))
         center_x = x + width // 2
-        pygame.draw.line(self.screen, (150, 150, 150),
-                        (center_x, y), (center_x, y + height), 2)
         
         # Value bar
         normalized_value = max(-1, min(1, value / max_value))
@@ -356,9 +414,29 @@ class PIDSimulator:
         pygame.draw.rect(self.screen, color, bar_rect)
         
         # Label
-        label_text = self.small_font.render(label, True, (0, 0, 0))
+        label_text = self.render_text(label, self.small_font, (0, 0, 0))
         self.screen.blit(label_text, (x - 25, y))  # Adjust label position
         
+    def build_bar_template(self, width, height) -> pygame.Surface:
+        """Render the static background of a component bar"""
+        template = pygame.Surface((width, height)).convert()
+        
+        # Background
+        bg_rect = template.get_rect()
+        pygame.draw.rect(template, (200, 200, 200), bg_rect)
+        pygame.draw.rect(template, (100, 100, 100), bg_rect, 1)
+        
+        # Center line
+        center_x = width // 2
+        pygame.draw.line(template, (150, 150, 150),
+                        (center_x, 0), (center_x, height), 2)
+        return template
+        
+    def update_graphs(self):
+        """Re-render the graphs and mark their screen region for display"""
+        self.graph_plotter.update()
+        self.graph_dirty = True
+        
     def reset_simulation(self):
         """Reset simulation to initial state"""
         # Reset platform position
@@ -377,11 +455,30 @@ class PIDSimulator:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+                continue
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.full_redraw = True
+                continue
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Only handle clicks in simulation area
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                mouse_x, mouse_y = event.pos
                 if mouse_x < self.sim_width and mouse_y < self.sim_height:
                     self.platform.set_position(mouse_x)
+            elif event.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
+                # Anything queued before the event filter was set up
+                continue
+                    
+            # Skip the widgets unless the pointer is over the panel, has just
+            # left it (to clear hover) or is dragging from it
+            in_panel = self.panel_rect.collidepoint(event.pos)
+            if not (in_panel or self.pointer_in_panel or self.panel_captured
+                    or event.type == pygame.MOUSEBUTTONUP):
+                continue
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.panel_captured = in_panel
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self.panel_captured = False
+            self.pointer_in_panel = in_panel
                 
             # Handle control panel events
             changed = self.control_panel.handle_event(event)
@@ -400,12 +497,11 @@ class PIDSimulator:
                 if 'wind' in changed:
                     self.platform.wind_force = changed['wind']
                 # Update enabled states
-                if 'kp_enabled' in changed:
-                    self.pid_enabled['kp'] = changed['kp_enabled']
-                if 'ki_enabled' in changed:
-                    self.pid_enabled['ki'] = changed['ki_enabled']
-                if 'kd_enabled' in changed:
-                    self.pid_enabled['kd'] = changed['kd_enabled']
+                if ('kp_enabled' in changed or 'ki_enabled' in changed
+                        or 'kd_enabled' in changed):
+                    values = self.control_panel.get_values()
+                    self.pid.set_enabled(values['kp_enabled'], values['ki_enabled'],
+                                         values['kd_enabled'])
                 # Update simulation speed
                 if 'speed' in changed:
                     self.simulation_speed = changed['speed']
@@ -418,62 +514,92 @@ class PIDSimulator:
                 # Handle zoom buttons
                 if 'zoom_in' in changed:
                     self.graph_plotter.zoom_in_y()
-                    self.graph_plotter.update()
+                    self.update_graphs()
                 if 'zoom_out' in changed:
                     self.graph_plotter.zoom_out_y()
-                    self.graph_plotter.update()
+                    self.update_graphs()
                 if 'auto_scale' in changed:
                     self.graph_plotter.auto_scale()
-                    self.graph_plotter.update()
+                    self.update_graphs()
                 
+    def wait_next_frame(self):
+        """Sleep coarsely, then spin until the next frame boundary"""
+        now = time.monotonic_ns()
+        self.next_frame_ns += self.frame_ns
+        if self.next_frame_ns < now:
+            # Running behind: resync instead of bursting to catch up
+            self.next_frame_ns = now
+            return
+        
+        remaining = self.next_frame_ns - now
+        if remaining > 2_000_000:
+            time.sleep((remaining - 1_000_000) / 1e9)
+        while time.monotonic_ns() < self.next_frame_ns:
+            time.sleep(0)
+        
     def run(self):
+        # Bind per-frame lookups to locals once; these objects live for the
+        # whole session (resets mutate them in place)
+        pid = self.pid
+        platform = self.platform
+        pid_update = pid.update
+        pid_get_components = pid.get_components
+        platform_apply_force = platform.apply_force
+        platform_update = platform.update
+        platform_get_position = platform.get_position
+        add_graph_data = self.graph_plotter.add_data
+        center_x = self.center_x
+        dt = self.dt
+        
         while self.running:
             self.handle_events()
             
             # PID control with simulation speed
-            sim_dt = self.dt * self.simulation_speed
+            sim_dt = dt * self.simulation_speed
             
-            force = self.pid.update(
-                setpoint=self.center_x,
-                current_value=self.platform.get_position(),
-                dt=sim_dt,
-                enabled=self.pid_enabled
+            force = pid_update(
+                setpoint=center_x,
+                current_value=platform_get_position(),
+                dt=sim_dt
             )
-            self.platform.apply_force(force)
+            platform_apply_force(force)
             
-            self.platform.update(sim_dt)
+            platform_update(sim_dt)
             
             # Update simulation time
             self.simulation_time += sim_dt
             
             # Collect data for graphs
-            p_component, i_component, d_component = self.pid.get_components()
+            p_component, i_component, d_component = pid_get_components()
             
             # Apply enabled states to components
-            if not self.pid_enabled.get('kp', True):
+            if not pid.kp_on:
                 p_component = 0
-            if not self.pid_enabled.get('ki', True):
+            if not pid.ki_on:
                 i_component = 0
-            if not self.pid_enabled.get('kd', True):
+            if not pid.kd_on:
                 d_component = 0
             
-            self.graph_plotter.add_data(
+            # Shared with the draw methods for this frame
+            self.components = (p_component, i_component, d_component)
+            
+            add_graph_data(
                 time=self.simulation_time,
-                error=self.pid.state.error,
-                output=self.pid.state.output,
+                error=pid.state.error,
+                output=pid.state.output,
                 p_component=p_component,
                 i_component=i_component,
                 d_component=d_component
             )
             
             # Update graphs periodically (based on real time)
-            real_time = time.time() - self.start_time
-            if real_time - self.last_graph_update > self.graph_update_interval:
-                self.graph_plotter.update()
-                self.last_graph_update = real_time
+            real_ns = time.monotonic_ns() - self.start_ns
+            if real_ns - self.last_graph_ns > self.graph_interval_ns:
+                self.update_graphs()
+                self.last_graph_ns = real_ns
             
             self.draw()
-            self.clock.tick(self.config.fps)
+            self.wait_next_frame()
         
         pygame.quit()
 
@@ -4,6 +4,11 @@ from typing import Tuple
 
 
 class Platform:
+    __slots__ = (
+        'x', 'y', '_mass', 'inv_mass', 'velocity', 'acceleration', 'width',
+        'height', 'color', 'sprite', 'wind_force'
+    )
+    
     def __init__(self, x: float, y: float, mass: float = 1.0):
         self.x = x
         self.y = y
@@ -15,47 +20,65 @@ class Platform:
         self.width = 100
         self.height = 20
         self.color = (100, 100, 200)
+        self.sprite = None  # Built on first draw, once a display exists
         
         # Physics parameters
         self.wind_force = 0.0
         
+    @property
+    def mass(self) -> float:
+        """Platform mass; setting it also updates inv_mass"""
+        return self._mass
+    
+    @mass.setter
+    def mass(self, mass: float):
+        self._mass = mass
+        self.inv_mass = 1.0 / mass
+        
     def apply_force(self, force: float):
         """Apply horizontal force to the platform"""
-        self.acceleration = force / self.mass
+        self.acceleration = force * self.inv_mass
         
     def update(self, dt: float):
         """Update platform physics"""
+        # Read state into locals once; written back at the end
+        mass = self._mass
+        inv_mass = self.inv_mass
+        velocity = self.velocity
+        acceleration = self.acceleration
+        wind_force = self.wind_force
+        
         # Store the control force before modifications
-        control_force = self.acceleration * self.mass
+        control_force = acceleration * mass
         
         # Apply wind as a constant external force
-        wind_acceleration = self.wind_force / self.mass
+        wind_acceleration = wind_force * inv_mass
         
-        # Apply velocity-dependent damping
+        # Velocity-dependent damping coefficient
         damping = 0.1
-        damping_acceleration = -damping * self.velocity
         
         # Calculate total force including wind
-        total_force = control_force + self.wind_force
+        total_force = control_force + wind_force
         
         # Apply deadband - if total force is too small, platform doesn't move
         deadband_threshold = 5.0
         
         if abs(total_force) < deadband_threshold:
             # In deadband - high static friction prevents movement
-            if abs(self.velocity) < 0.5:
+            if abs(velocity) < 0.5:
                 # Stop completely if moving slowly
                 self.velocity = 0
                 self.acceleration = 0
                 return
             else:
                 # Apply heavy damping if still moving
-                damping_acceleration = -0.5 * self.velocity
+                damping = 0.5
         
-        # Update velocity and position
-        total_acceleration = self.acceleration + wind_acceleration + damping_acceleration
-        self.velocity += total_acceleration * dt
-        self.x += self.velocity * dt
+        # Update velocity and position; damping (-damping * velocity) is
+        # folded into a single scale of the old velocity
+        velocity = velocity * (1.0 - damping * dt) + (acceleration + wind_acceleration) * dt
+        self.velocity = velocity
+        self.x += velocity * dt
         
         # Reset acceleration for next frame
         self.acceleration = 0.0
@@ -66,17 +89,66 @@ class Platform:
         self.velocity = 0.0
         self.acceleration = 0.0
         
-    def draw(self, screen: pygame.Surface):
-        """Draw the platform"""
-        rect = pygame.Rect(
-            self.x - self.width // 2,
-            self.y - self.height // 2,
-            self.width,
-            self.height
-        )
-        pygame.draw.rect(screen, self.color, rect)
-        pygame.draw.rect(screen, (50, 50, 100), rect, 2)  # Border
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """Draw the platform and return the screen area it covers"""
+        if self.sprite is None:
+            self.sprite = self._build_sprite()
+        # blit() reports the covered area clipped to the screen, so no
+        # separate Rect has to be built for it
+        return screen.blit(self.sprite, (self.x - self.width // 2, self.y - self.height // 2))
+        
+    def _build_sprite(self) -> pygame.Surface:
+        """Pre-render the filled, bordered platform"""
+        sprite = pygame.Surface((self.width, self.height)).convert()
+        sprite.fill(self.color)
+        pygame.draw.rect(sprite, (50, 50, 100), sprite.get_rect(), 2)  # Border
+        return sprite
         
     def get_position(self) -> float:
         """Get current x position"""
-        return self.x
\ No newline at end of file
+        return self.x
+
+
+class PlatformBatch:
+    """Many platforms stepped together with NumPy (same physics as Platform)"""
+    def __init__(self, x: np.ndarray, mass: float = 1.0):
+        # One array per quantity, one element per platform
+        self.x = np.array(x, dtype=float)
+        n = self.x.size
+        self.velocity = np.zeros(n)
+        self.acceleration = np.zeros(n)
+        self.wind_force = np.zeros(n)
+        self.set_mass(mass)
+        
+    def set_mass(self, mass):
+        """Set the mass of every platform (scalar or per-platform array)"""
+        self.mass = np.broadcast_to(np.asarray(mass, dtype=float), self.x.shape).copy()
+        self.inv_mass = 1.0 / self.mass
+        
+    def apply_force(self, force):
+        """Apply horizontal force to each platform"""
+        np.multiply(force, self.inv_mass, out=self.acceleration)
+        
+    def update(self, dt: float):
+        """Update platform physics"""
+        velocity = self.velocity
+        acceleration = self.acceleration
+        
+        # Deadband on the total force; slow platforms inside it stop
+        total_force = acceleration * self.mass + self.wind_force
+        in_deadband = np.abs(total_force) < 5.0
+        stopped = in_deadband & (np.abs(velocity) < 0.5)
+        damping = np.where(in_deadband, 0.5, 0.1)
+        
+        # Same damped velocity update as Platform.update
+        velocity *= 1.0 - damping * dt
+        velocity += (acceleration + self.wind_force * self.inv_mass) * dt
+        velocity[stopped] = 0.0
+        self.x += velocity * dt
+        
+        # Reset acceleration for next step
+        acceleration.fill(0.0)
+        
+    def get_position(self) -> np.ndarray:
+        """Get current x positions"""
+        return self.x
@@ -14,14 +14,23 @@ class PIDState:
 
 
 class PIDController:
+    __slots__ = (
+        'kp', 'ki', 'kd', 'kp_on', 'ki_on', 'kd_on', 'state', 'integral_limit',
+        'output_limit'
+    )
+    
     def __init__(self, kp: float = 1.0, ki: float = 0.0, kd: float = 0.0):
         self.kp = kp  # Proportional gain
         self.ki = ki  # Integral gain
         self.kd = kd  # Derivative gain
         
+        # Component enabled states, changed through set_enabled()
+        self.kp_on = self.ki_on = self.kd_on = True
+        
         self.state = PIDState()
         
-        # Anti-windup limits
+        # Anti-windup limits (conditional integration in update(), plus this
+        # hard bound on the integral)
         self.integral_limit = 1000.0
         
         # Output limits
@@ -36,53 +45,144 @@ class PIDController:
             setpoint: Target value
             current_value: Current measured value
             dt: Time step
-            enabled: Dict with 'kp', 'ki', 'kd' keys indicating if each component is enabled
+            enabled: Optional dict with 'kp', 'ki', 'kd' keys overriding the
+                enabled states from set_enabled()
             
         Returns:
             Control output (force to apply)
         """
         if enabled is None:
-            enabled = {'kp': True, 'ki': True, 'kd': True}
+            kp_on, ki_on, kd_on = self.kp_on, self.ki_on, self.kd_on
+        else:
+            kp_on = enabled.get('kp', True)
+            ki_on = enabled.get('ki', True)
+            kd_on = enabled.get('kd', True)
+        
+        # Work on locals; the state is written back once at the end
+        state = self.state
+        
         # Calculate error
-        self.state.error = setpoint - current_value
+        error = setpoint - current_value
         
         # Proportional term
-        p_term = self.kp * self.state.error if enabled.get('kp', True) else 0.0
-        
-        # Integral term with anti-windup
-        if enabled.get('ki', True):
-            self.state.integral += self.state.error * dt
-            self.state.integral = np.clip(
-                self.state.integral, 
-                -self.integral_limit, 
-                self.integral_limit
-            )
-            i_term = self.ki * self.state.integral
+        p_term = self.kp * error if kp_on else 0.0
+        
+        # Derivative term (zero for a non-positive time step)
+        if kd_on:
+            inv_dt = 1.0 / dt if dt > 0.0 else 0.0
+            derivative = (error - state.last_error) * inv_dt
+            d_term = self.kd * derivative
+        else:
+            derivative = 0.0
+            d_term = 0.0
+        
+        # Integral term with anti-windup: conditional integration only
+        # accumulates error while the output is within limits or the error
+        # drives it back out of saturation
+        output_limit = self.output_limit
+        integral = state.integral
+        if ki_on:
+            ki = self.ki
+            candidate = integral + error * dt
+            unsaturated = p_term + ki * candidate + d_term
+            if -output_limit <= unsaturated <= output_limit or (unsaturated > 0) != (error > 0):
+                # Hard bound still applies, e.g. while ki is zero
+                integral_limit = self.integral_limit
+                integral = max(-integral_limit, min(candidate, integral_limit))
+            i_term = ki * integral
         else:
             i_term = 0.0
         
+        # Calculate total output and apply output limits
+        output = max(-output_limit, min(p_term + i_term + d_term, output_limit))
+        
+        state.error = error
+        state.integral = integral
+        state.derivative = derivative
+        state.output = output
+        
+        # Store error for next iteration
+        state.last_error = error
+        
+        return output
+    
+    def update_batch(self, setpoints: np.ndarray, values: np.ndarray, dt: float,
+                     enabled: Optional[dict] = None) -> np.ndarray:
+        """
+        Calculate PID outputs for a sequence of samples in one call
+        
+        The measurements are given up front (open loop), e.g. for offline
+        gain sweeps. Equivalent to calling update() once per sample: the
+        proportional and derivative terms are vectorized, the integral is
+        accumulated sample by sample with the same conditional integration.
+        
+        Args:
+            setpoints: Target value per sample
+            values: Measured value per sample
+            dt: Time step between samples
+            enabled: Optional dict with 'kp', 'ki', 'kd' keys overriding the
+                enabled states from set_enabled()
+            
+        Returns:
+            Array of control outputs
+        """
+        if enabled is None:
+            kp_on, ki_on, kd_on = self.kp_on, self.ki_on, self.kd_on
+        else:
+            kp_on = enabled.get('kp', True)
+            ki_on = enabled.get('ki', True)
+            kd_on = enabled.get('kd', True)
+        
+        state = self.state
+        errors = np.asarray(setpoints, dtype=float) - np.asarray(values, dtype=float)
+        if errors.size == 0:
+            return errors
+        
+        zeros = np.zeros_like(errors)
+        
+        # Proportional term
+        p_terms = self.kp * errors if kp_on else zeros
+        
         # Derivative term
-        if enabled.get('kd', True) and dt > 0:
-            self.state.derivative = (self.state.error - self.state.last_error) / dt
-            d_term = self.kd * self.state.derivative
+        if kd_on and dt > 0:
+            derivative = np.diff(errors, prepend=state.last_error) / dt
+            d_terms = self.kd * derivative
+            state.derivative = float(derivative[-1])
         else:
-            self.state.derivative = 0.0
-            d_term = 0.0
+            d_terms = zeros
+            state.derivative = 0.0
+        
+        # Integral term with the same conditional integration as update().
+        # Whether a sample integrates depends on the integral so far, so
+        # this part runs sample by sample
+        if ki_on:
+            ki = self.ki
+            output_limit = self.output_limit
+            integral_limit = self.integral_limit
+            integral = state.integral
+            integrals = np.empty_like(errors)
+            for i, (error, p_term, d_term) in enumerate(
+                    zip(errors.tolist(), p_terms.tolist(), d_terms.tolist())):
+                candidate = integral + error * dt
+                unsaturated = p_term + ki * candidate + d_term
+                if -output_limit <= unsaturated <= output_limit or (unsaturated > 0) != (error > 0):
+                    integral = max(-integral_limit, min(candidate, integral_limit))
+                integrals[i] = integral
+            i_terms = ki * integrals
+            state.integral = integral
+        else:
+            i_terms = zeros
         
         # Calculate total output
-        self.state.output = p_term + i_term + d_term
+        output = p_terms + i_terms + d_terms
         
         # Apply output limits
-        self.state.output = np.clip(
-            self.state.output,
-            -self.output_limit,
-            self.output_limit
-        )
+        np.clip(output, -self.output_limit, self.output_limit, out=output)
         
-        # Store error for next iteration
-        self.state.last_error = self.state.error
+        state.error = state.last_error = float(errors[-1])
+        state.output = float(output[-1])
         
-        return self.state.output
+        return output
     
     def reset(self):
         """Reset the controller state"""
@@ -94,6 +194,12 @@ class PIDController:
         self.ki = ki
         self.kd = kd
         
+    def set_enabled(self, kp: bool, ki: bool, kd: bool):
+        """Enable or disable the individual PID components"""
+        self.kp_on = kp
+        self.ki_on = ki
+        self.kd_on = kd
+        
     def get_components(self) -> tuple:
         """Get individual PID components for visualization"""
         p_term = self.kp * self.state.error
@@ -1,11 +1,18 @@
 import pygame
-from typing import Callable, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 
 class Slider:
+    __slots__ = (
+        'rect', 'min_val', 'max_val', 'value', 'label', 'bg_color', 'fg_color',
+        'handle_color', 'text_color', 'left', 'right', 'fill_scale',
+        'value_scale', 'fill_rect', 'handle_rect', 'dragging', 'dirty', 'font',
+        'label_cache', 'label_cache_size', 'chrome', 'bounds'
+    )
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  min_val: float, max_val: float, initial_val: float,
-                 label: str):
+                 label: str, font: Optional[pygame.font.Font] = None):
         self.rect = pygame.Rect(x, y, width, height)
         self.min_val = min_val
         self.max_val = max_val
@@ -18,15 +25,40 @@ class Slider:
         self.handle_color = (50, 50, 150)
         self.text_color = (0, 0, 0)
         
+        # Geometry reused by draw and drags; only widths and positions change
+        self.left = x
+        self.right = x + width
+        self.fill_scale = width / (max_val - min_val)
+        self.value_scale = (max_val - min_val) / width
+        self.fill_rect = pygame.Rect(x, y, 0, height)
+        self.handle_rect = pygame.Rect(x - 5, y - 5, 10, height + 10)
+        
+        # Screen area draw() may touch: the handle overhang and the label above
+        self.bounds = pygame.Rect(x - 5, y - 30, width + 10, height + 35)
+        
         # State
         self.dragging = False
+        self.dirty = False  # Set when the look changes, cleared by the owner
+        
+        # Font, usually shared with the other sliders of the panel
+        self.font = font if font is not None else pygame.font.Font(None, 28)
         
-        # Font
-        self.font = pygame.font.Font(None, 28)
+        # Rendered "label: value" texts, keyed by the displayed string
+        self.label_cache = {}
+        self.label_cache_size = 64
+        
+        # Pre-rendered background and border, built on first draw
+        self.chrome = None
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame events, return True if value changed"""
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        # Motion first: it is by far the most frequent event
+        if event.type == pygame.MOUSEMOTION:
+            if self.dragging:
+                self._update_value(event.pos[0])
+                return True
+                
+        elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.dragging = True
                 self._update_value(event.pos[0])
@@ -35,46 +67,67 @@ class Slider:
         elif event.type == pygame.MOUSEBUTTONUP:
             self.dragging = False
             
-        elif event.type == pygame.MOUSEMOTION:
-            if self.dragging:
-                self._update_value(event.pos[0])
-                return True
-                
         return False
     
     def _update_value(self, mouse_x: int):
         """Update value based on mouse position"""
         # Clamp mouse position to slider bounds
-        x = max(self.rect.left, min(mouse_x, self.rect.right))
+        left = self.left
+        right = self.right
+        x = left if mouse_x < left else (right if mouse_x > right else mouse_x)
         
         # Calculate value
-        ratio = (x - self.rect.left) / self.rect.width
-        self.value = self.min_val + ratio * (self.max_val - self.min_val)
+        self.value = self.min_val + (x - left) * self.value_scale
+        self.dirty = True
+        
+    @property
+    def engaged(self) -> bool:
+        """Whether the slider needs events from outside its rect"""
+        return self.dragging
         
     def draw(self, screen: pygame.Surface):
         """Draw the slider"""
         # Draw background
-        pygame.draw.rect(screen, self.bg_color, self.rect)
-        pygame.draw.rect(screen, (100, 100, 100), self.rect, 2)
+        if self.chrome is None:
+            self.chrome = self._build_chrome()
+        screen.blit(self.chrome, self.rect)
         
         # Draw filled portion
-        fill_ratio = (self.value - self.min_val) / (self.max_val - self.min_val)
-        fill_width = int(self.rect.width * fill_ratio)
-        fill_rect = pygame.Rect(self.rect.left, self.rect.top, fill_width, self.rect.height)
-        pygame.draw.rect(screen, self.fg_color, fill_rect)
+        fill_width = int((self.value - self.min_val) * self.fill_scale)
+        self.fill_rect.width = fill_width
+        pygame.draw.rect(screen, self.fg_color, self.fill_rect)
         
         # Draw handle
-        handle_x = self.rect.left + fill_width
-        handle_rect = pygame.Rect(handle_x - 5, self.rect.top - 5, 10, self.rect.height + 10)
-        pygame.draw.rect(screen, self.handle_color, handle_rect)
+        self.handle_rect.x = self.left + fill_width - 5
+        pygame.draw.rect(screen, self.handle_color, self.handle_rect)
         
         # Draw label and value
-        label_text = self.font.render(f"{self.label}: {self.value:.3f}", True, self.text_color)
+        text = f"{self.label}: {self.value:.3f}"
+        label_text = self.label_cache.get(text)
+        if label_text is None:
+            if len(self.label_cache) >= self.label_cache_size:
+                # Evict the oldest entry
+                del self.label_cache[next(iter(self.label_cache))]
+            label_text = self.font.render(text, True, self.text_color)
+            self.label_cache[text] = label_text
         screen.blit(label_text, (self.rect.left, self.rect.top - 30))
+        
+    def _build_chrome(self) -> pygame.Surface:
+        """Pre-render the slider background and border"""
+        chrome = pygame.Surface(self.rect.size).convert()
+        chrome.fill(self.bg_color)
+        pygame.draw.rect(chrome, (100, 100, 100), chrome.get_rect(), 2)
+        return chrome
 
 
 class Checkbox:
-    def __init__(self, x: int, y: int, size: int, label: str, checked: bool = True):
+    __slots__ = (
+        'rect', 'label', 'checked', 'bg_color', 'border_color', 'check_color',
+        'text_color', 'dirty', 'font', 'label_text', 'chrome', 'bounds'
+    )
+    
+    def __init__(self, x: int, y: int, size: int, label: str, checked: bool = True,
+                 font: Optional[pygame.font.Font] = None):
         self.rect = pygame.Rect(x, y, size, size)
         self.label = label
         self.checked = checked
@@ -85,41 +138,76 @@ class Checkbox:
         self.check_color = (50, 150, 50)
         self.text_color = (0, 0, 0)
         
-        # Font
-        self.font = pygame.font.Font(None, 24)
+        self.dirty = False  # Set when the look changes, cleared by the owner
+        
+        # Font, usually shared with the other checkboxes, and the
+        # pre-rendered label
+        self.font = font if font is not None else pygame.font.Font(None, 24)
+        self.label_text = self.font.render(self.label, True, self.text_color)
+        
+        # Pre-rendered (unchecked, checked) boxes, built on first draw
+        self.chrome = None
+        
+        # Screen area draw() touches: the box and its label, if any
+        self.bounds = self.rect
+        if self.label:
+            self.bounds = self.rect.union(self.label_text.get_rect(
+                left=self.rect.right + 10,
+                top=self.rect.centery - self.label_text.get_height() // 2
+            ))
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame events, return True if value changed"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.checked = not self.checked
+                self.dirty = True
                 return True
         return False
         
+    @property
+    def engaged(self) -> bool:
+        """Whether the checkbox needs events from outside its rect"""
+        return False
+        
     def draw(self, screen: pygame.Surface):
         """Draw the checkbox"""
-        # Draw box background
-        pygame.draw.rect(screen, self.bg_color, self.rect)
-        pygame.draw.rect(screen, self.border_color, self.rect, 2)
-        
-        # Draw check mark if checked
-        if self.checked:
-            # Draw a simple X
-            padding = 4
-            pygame.draw.line(screen, self.check_color,
-                           (self.rect.left + padding, self.rect.top + padding),
-                           (self.rect.right - padding, self.rect.bottom - padding), 3)
-            pygame.draw.line(screen, self.check_color,
-                           (self.rect.right - padding, self.rect.top + padding),
-                           (self.rect.left + padding, self.rect.bottom - padding), 3)
+        # Draw box, with a check mark if checked
+        if self.chrome is None:
+            self.chrome = (self._build_chrome(False), self._build_chrome(True))
+        screen.blit(self.chrome[self.checked], self.rect)
         
         # Draw label
-        label_text = self.font.render(self.label, True, self.text_color)
+        label_text = self.label_text
         screen.blit(label_text, (self.rect.right + 10, self.rect.centery - label_text.get_height() // 2))
         
+    def _build_chrome(self, checked: bool) -> pygame.Surface:
+        """Pre-render the box background and border, with or without the mark"""
+        chrome = pygame.Surface(self.rect.size).convert()
+        rect = chrome.get_rect()
+        chrome.fill(self.bg_color)
+        pygame.draw.rect(chrome, self.border_color, rect, 2)
+        if checked:
+            # Draw a simple X
+            padding = 4
+            pygame.draw.line(chrome, self.check_color,
+                           (rect.left + padding, rect.top + padding),
+                           (rect.right - padding, rect.bottom - padding), 3)
+            pygame.draw.line(chrome, self.check_color,
+                           (rect.right - padding, rect.top + padding),
+                           (rect.left + padding, rect.bottom - padding), 3)
+        return chrome
+        
 
 class Button:
-    def __init__(self, x: int, y: int, width: int, height: int, text: str):
+    __slots__ = (
+        'rect', 'text', 'normal_color', 'hover_color', 'pressed_color',
+        'text_color', 'hovered', 'pressed', 'dirty', 'font', 'text_surface',
+        'chrome', 'bounds'
+    )
+    
+    def __init__(self, x: int, y: int, width: int, height: int, text: str,
+                 font: Optional[pygame.font.Font] = None):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         
@@ -132,27 +220,45 @@ class Button:
         # State
         self.hovered = False
         self.pressed = False
+        self.dirty = False  # Set when the look changes, cleared by the owner
+        
+        # Font, usually shared with the other buttons, and the pre-rendered
+        # text
+        self.font = font if font is not None else pygame.font.Font(None, 26)
+        self.text_surface = self.font.render(self.text, True, self.text_color)
+        
+        # Pre-rendered button per fill color, built on first use
+        self.chrome = {}
         
-        # Font
-        self.font = pygame.font.Font(None, 26)
+        # Screen area draw() touches
+        self.bounds = self.rect
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame events, return True if button was clicked"""
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            hovered = self.rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.dirty = True
             
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.pressed = True
+                self.dirty = True
                 
         elif event.type == pygame.MOUSEBUTTONUP:
-            if self.pressed and self.rect.collidepoint(event.pos):
+            if self.pressed:
                 self.pressed = False
-                return True
-            self.pressed = False
+                self.dirty = True
+                return self.rect.collidepoint(event.pos)
             
         return False
         
+    @property
+    def engaged(self) -> bool:
+        """Whether the button needs events from outside its rect"""
+        return self.pressed or self.hovered
+        
     def draw(self, screen: pygame.Surface):
         """Draw the button"""
         # Choose color based on state
@@ -163,17 +269,25 @@ class Button:
         else:
             color = self.normal_color
             
-        # Draw button
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, (50, 50, 100), self.rect, 2)
-        
-        # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        # Draw button with its text
+        chrome = self.chrome.get(color)
+        if chrome is None:
+            chrome = self.chrome[color] = self._build_chrome(color)
+        screen.blit(chrome, self.rect)
+        
+    def _build_chrome(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Pre-render the button body, border and text in the given color"""
+        chrome = pygame.Surface(self.rect.size).convert()
+        rect = chrome.get_rect()
+        chrome.fill(color)
+        pygame.draw.rect(chrome, (50, 50, 100), rect, 2)
+        chrome.blit(self.text_surface, self.text_surface.get_rect(center=rect.center))
+        return chrome
 
 
 class ControlPanel:
+    MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+    
     def __init__(self, x: int, y: int):
         self.x = x
         self.y = y
@@ -182,38 +296,50 @@ class ControlPanel:
         self.slider_height = 20
         self.slider_spacing = 60
         
+        # One font per widget kind, shared by all widgets of that kind. They
+        # belong to this panel (and so to the current pygame session)
+        slider_font = pygame.font.Font(None, 28)
+        checkbox_font = pygame.font.Font(None, 24)
+        button_font = pygame.font.Font(None, 26)
+        
         # Create sliders with adjusted positions
         slider_x = x + self.padding + 30  # Make room for checkboxes
         self.sliders = {
             'kp': Slider(slider_x, y + self.padding, 
                         self.width - 50, self.slider_height,
-                        0.0, 20.0, 5.0, "Kp (Proportional)"),
+                        0.0, 20.0, 5.0, "Kp (Proportional)",
+                        font=slider_font),
             'ki': Slider(slider_x, y + self.padding + self.slider_spacing,
                         self.width - 50, self.slider_height,
-                        0.0, 3.0, 0.5, "Ki (Integral)"),
+                        0.0, 3.0, 0.5, "Ki (Integral)",
+                        font=slider_font),
             'kd': Slider(slider_x, y + self.padding + 2 * self.slider_spacing,
                         self.width - 50, self.slider_height,
-                        0.0, 10.0, 2.0, "Kd (Derivative)"),
+                        0.0, 10.0, 2.0, "Kd (Derivative)",
+                        font=slider_font),
             'mass': Slider(x + self.padding, y + self.padding + 3 * self.slider_spacing,
                           self.width - 2 * self.padding, self.slider_height,
-                          0.1, 10.0, 1.0, "Mass"),
+                          0.1, 10.0, 1.0, "Mass",
+                          font=slider_font),
             'speed': Slider(x + self.padding, y + self.padding + 4 * self.slider_spacing,
                           self.width - 2 * self.padding, self.slider_height,
-                          0.5, 5.0, 2.2, "Simulation Speed"),
+                          0.5, 5.0, 2.2, "Simulation Speed",
+                          font=slider_font),
             'wind': Slider(x + self.padding, y + self.padding + 5 * self.slider_spacing,
                           self.width - 2 * self.padding, self.slider_height,
-                          -20.0, 20.0, 0.0, "Wind Force"),
+                          -20.0, 20.0, 0.0, "Wind Force",
+                          font=slider_font),
         }
         
         # Create checkboxes for PID components
         checkbox_size = 20
         self.checkboxes = {
             'kp_enabled': Checkbox(x + self.padding, y + self.padding + 5, 
-                                  checkbox_size, "", True),
+                                  checkbox_size, "", True, checkbox_font),
             'ki_enabled': Checkbox(x + self.padding, y + self.padding + self.slider_spacing + 5,
-                                  checkbox_size, "", True),
+                                  checkbox_size, "", True, checkbox_font),
             'kd_enabled': Checkbox(x + self.padding, y + self.padding + 2 * self.slider_spacing + 5,
-                                  checkbox_size, "", True),
+                                  checkbox_size, "", True, checkbox_font),
         }
         
         # Create buttons - first row
@@ -223,7 +349,8 @@ class ControlPanel:
             y + self.padding + 6 * self.slider_spacing,
             button_width,
             30,
-            "Reset Graphs"
+            "Reset Graphs",
+            button_font
         )
         
         self.reset_sim_button = Button(
@@ -231,7 +358,8 @@ class ControlPanel:
             y + self.padding + 6 * self.slider_spacing,
             button_width,
             30,
-            "Reset Simulation"
+            "Reset Simulation",
+            button_font
         )
         
         # Create buttons - second row for graph controls
@@ -241,7 +369,8 @@ class ControlPanel:
             y + self.padding + 6 * self.slider_spacing + 40,
             button_width_small,
             30,
-            "Zoom In Y"
+            "Zoom In Y",
+            button_font
         )
         
         self.zoom_out_button = Button(
@@ -249,7 +378,8 @@ class ControlPanel:
             y + self.padding + 6 * self.slider_spacing + 40,
             button_width_small,
             30,
-            "Zoom Out Y"
+            "Zoom Out Y",
+            button_font
         )
         
         self.auto_scale_button = Button(
@@ -257,7 +387,8 @@ class ControlPanel:
             y + self.padding + 6 * self.slider_spacing + 40,
             button_width_small,
             30,
-            "Auto Scale"
+            "Auto Scale",
+            button_font
         )
         
         # Background
@@ -267,42 +398,154 @@ class ControlPanel:
         # Calculate total height
         self.height = 7 * self.slider_spacing + 2 * self.padding
         
+        self.buttons = (
+            self.reset_graphs_button, self.reset_sim_button,
+            self.zoom_in_button, self.zoom_out_button, self.auto_scale_button
+        )
+        
+        # Event dispatch table: (changed key, widget, attribute reported as
+        # the changed value, or None for buttons)
+        self.widgets = (
+            [(name, slider, 'value') for name, slider in self.sliders.items()]
+            + [(name, checkbox, 'checked') for name, checkbox in self.checkboxes.items()]
+            + [
+                ('reset_graphs', self.reset_graphs_button, None),
+                ('reset_simulation', self.reset_sim_button, None),
+                ('zoom_in', self.zoom_in_button, None),
+                ('zoom_out', self.zoom_out_button, None),
+                ('auto_scale', self.auto_scale_button, None),
+            ]
+        )
+        
+        # Partial redraws restore and redraw one widget's bounds at a time,
+        # which is only correct while no two widgets' bounds overlap
+        assert not any(
+            a.bounds.colliderect(b.bounds)
+            for i, (_, a, _) in enumerate(self.widgets)
+            for _, b, _ in self.widgets[i + 1:]
+        ), "ControlPanel widgets overlap"
+        
+        # Widgets dragged, pressed or hovered by earlier events, and the
+        # (key, slider) being dragged, which takes all motion events
+        self.engaged_widgets = []
+        self.captured = None
+        
+        # Reused result of handle_event and the current widget values, kept
+        # up to date as widgets change
+        self.changed = {}
+        self.values = {name: slider.value for name, slider in self.sliders.items()}
+        self.values.update({name: checkbox.checked for name, checkbox in self.checkboxes.items()})
+        
+        # The rendered panel is kept and blitted; only widgets that changed
+        # are redrawn over it. It also covers the slider labels drawn above
+        # the panel's top edge
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.cache_rect = self.rect.unionall([
+            slider.bounds for slider in self.sliders.values()
+        ])
+        self.cache_surface = None
+        self.dirty = True  # Redraw everything on the next draw
+        self.dirty_widgets = []
+        
+        # Pre-rendered panel background and border, built on first draw,
+        # and the panel area as it looks without any widgets
+        self.background = None
+        self.clean_surface = None
+        
     def handle_event(self, event: pygame.event.Event) -> dict:
-        """Handle events and return dict of changed values"""
-        changed = {}
-        for name, slider in self.sliders.items():
+        """
+        Handle events and return dict of changed values
+        
+        The returned dict is reused and only valid until the next call.
+        """
+        changed = self.changed
+        changed.clear()
+        if event.type not in self.MOUSE_EVENTS:
+            # Widgets only react to the mouse
+            return changed
+        
+        captured = self.captured
+        if captured is not None and event.type == pygame.MOUSEMOTION:
+            # Fast path while dragging: only the captured slider reacts
+            name, slider = captured
             if slider.handle_event(event):
-                changed[name] = slider.value
-        
-        for name, checkbox in self.checkboxes.items():
-            if checkbox.handle_event(event):
-                changed[name] = checkbox.checked
-                
-        # Handle reset buttons
-        if self.reset_graphs_button.handle_event(event):
-            changed['reset_graphs'] = True
-            
-        if self.reset_sim_button.handle_event(event):
-            changed['reset_simulation'] = True
-            
-        # Handle zoom buttons
-        if self.zoom_in_button.handle_event(event):
-            changed['zoom_in'] = True
+                changed[name] = self.values[name] = slider.value
+                slider.dirty = False
+                if slider not in self.dirty_widgets:
+                    self.dirty_widgets.append(slider)
+            return changed
+        
+        pos = event.pos
+        engaged = self.engaged_widgets
+        if not engaged and not self.rect.collidepoint(pos):
+            # Nothing outside the panel concerns idle widgets
+            return changed
+        
+        dirty_widgets = self.dirty_widgets
+        for name, widget, attr in self.widgets:
+            # Only widgets under the pointer or engaged by earlier events
+            # can react to it
+            if widget not in engaged and not widget.rect.collidepoint(pos):
+                continue
             
-        if self.zoom_out_button.handle_event(event):
-            changed['zoom_out'] = True
-            
-        if self.auto_scale_button.handle_event(event):
-            changed['auto_scale'] = True
+            if widget.handle_event(event):
+                if attr:
+                    changed[name] = self.values[name] = getattr(widget, attr)
+                else:
+                    changed[name] = True
+                
+            if widget.engaged:
+                if widget not in engaged:
+                    engaged.append(widget)
+                if isinstance(widget, Slider):
+                    self.captured = (name, widget)
+            elif widget in engaged:
+                engaged.remove(widget)
+                if captured is not None and widget is captured[1]:
+                    self.captured = None
                 
+            # Widgets whose value or look changed are redrawn on the next draw
+            if widget.dirty:
+                widget.dirty = False
+                if widget not in dirty_widgets:
+                    dirty_widgets.append(widget)
+            
         return changed
         
-    def draw(self, screen: pygame.Surface):
-        """Draw the control panel"""
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Draw the control panel and return the screen areas that changed"""
+        if self.dirty:
+            return self._draw_all(screen)
+        
+        screen.blit(self.cache_surface, self.cache_rect)
+        if not self.dirty_widgets:
+            return []
+        
+        # Restore the clean panel under each changed widget and redraw it
+        offset = (-self.cache_rect.x, -self.cache_rect.y)
+        rects = []
+        for widget in self.dirty_widgets:
+            local = widget.bounds.move(offset)
+            screen.blit(self.clean_surface, widget.bounds, local)
+            widget.draw(screen)
+            self.cache_surface.blit(screen, local, widget.bounds)
+            rects.append(widget.bounds)
+        self.dirty_widgets.clear()
+        return rects
+        
+    def _draw_all(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Render the whole panel and keep it for the following frames"""
         # Draw background
-        panel_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(screen, self.bg_color, panel_rect)
-        pygame.draw.rect(screen, self.border_color, panel_rect, 2)
+        if self.background is None:
+            self.background = pygame.Surface(self.rect.size).convert()
+            self.background.fill(self.bg_color)
+            pygame.draw.rect(self.background, self.border_color, self.background.get_rect(), 2)
+        screen.blit(self.background, self.rect)
+        
+        if self.cache_surface is None:
+            self.cache_surface = pygame.Surface(self.cache_rect.size).convert()
+            self.clean_surface = pygame.Surface(self.cache_rect.size).convert()
+        self.clean_surface.blit(screen, (0, 0), self.cache_rect)
         
         # Draw sliders
         for slider in self.sliders.values():
@@ -313,14 +556,14 @@ class ControlPanel:
             checkbox.draw(screen)
             
         # Draw all buttons
-        self.reset_graphs_button.draw(screen)
-        self.reset_sim_button.draw(screen)
-        self.zoom_in_button.draw(screen)
-        self.zoom_out_button.draw(screen)
-        self.auto_scale_button.draw(screen)
+        for button in self.buttons:
+            button.draw(screen)
             
+        self.cache_surface.blit(screen, (0, 0), self.cache_rect)
+        self.dirty = False
+        self.dirty_widgets.clear()
+        return [self.cache_rect]
+        
     def get_values(self) -> dict:
-        """Get current values of all sliders and checkboxes"""
-        values = {name: slider.value for name, slider in self.sliders.items()}
-        values.update({name: checkbox.checked for name, checkbox in self.checkboxes.items()})
-        return values
\ No newline at end of file
+        """Get current values of all sliders and checkboxes (do not modify)"""
+        return self.values
\ No newline at end of file